@@ -1,14 +1,27 @@
 from __future__ import annotations
 
 import argparse
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
+import io
+import itertools
+import os
 from pathlib import Path
 import re
+import shutil
 import sys
-from typing import Iterable, List, Optional
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
 
 import sqlglot
 from sqlglot import exp
+from sqlglot.errors import ParseError, TokenError
+
+try:
+    import hyperscan
+except ImportError:  # optional: plain substring checks are used instead
+    hyperscan = None
 
 
 @dataclass(frozen=True)
@@ -21,105 +34,105 @@ _DEFINER_RE = re.compile(
     r"\bDEFINER\s*=\s*`[^`]+`\s*@\s*`[^`]+`\s*",
     flags=re.IGNORECASE,
 )
+_DEFINER_SUB = _DEFINER_RE.sub
 
+# Statements per unit of work when converting a streamed input.
+_STREAM_BATCH_STATEMENTS = 16
+# Starting a process pool costs about as much as converting this many statements serially.
+_PARALLEL_MIN_STATEMENTS = 256
 
-def _preprocess_mysql_sql(sql_text: str) -> str:
-    """Best-effort cleanup of MySQL-only clauses before parsing."""
-    # MySQL view/proc definer clause has no direct PG equivalent.
-    sql_text = _DEFINER_RE.sub("", sql_text)
-    return sql_text
+# Building a Generator is not free; reuse one per dialect for every render.
+_PG_GEN = sqlglot.Dialect.get_or_raise("postgres").generator()
+_MYSQL_GEN = sqlglot.Dialect.get_or_raise("mysql").generator()
+_PG_GENERATE = _PG_GEN.generate
 
 
-def _is_collate_column_constraint(column_constraint: exp.Expression) -> bool:
-    kind = getattr(column_constraint, "args", {}).get("kind")
-    return kind is not None and kind.__class__.__name__ == "CollateColumnConstraint"
+def _pg(node: exp.Expression) -> str:
+    return _PG_GENERATE(node, copy=False)
 
 
-def _is_on_update_column_constraint(column_constraint: exp.Expression) -> bool:
-    kind = getattr(column_constraint, "args", {}).get("kind")
-    return kind is not None and kind.__class__.__name__ == "OnUpdateColumnConstraint"
+def _mysql(node: exp.Expression) -> str:
+    # MySQL renders are only used for detection and TODO comments, and the same AST is
+    # rendered for PostgreSQL afterwards. Generators rewrite nodes while rendering
+    # (e.g. MySQL unwraps TsOrDsToTimestamp), so keep this one non-destructive.
+    return _MYSQL_GEN.generate(node, copy=True)
 
 
-def _is_auto_increment_column_constraint(column_constraint: exp.Expression) -> bool:
-    kind = getattr(column_constraint, "args", {}).get("kind")
-    return kind is not None and kind.__class__.__name__ == "AutoIncrementColumnConstraint"
+def _preprocess_mysql_sql(sql_text: str) -> str:
+    """Best-effort cleanup of MySQL-only clauses before parsing."""
+    # MySQL view/proc definer clause has no direct PG equivalent.
+    # Most dumps have none; a C-level substring test is far cheaper than a regex scan.
+    if "DEFINER" not in sql_text.upper():
+        return sql_text
+    sql_text = _DEFINER_SUB("", sql_text)
+    return sql_text
 
 
-def _strip_column_collations(schema: exp.Schema) -> None:
-    for element in list(schema.expressions or []):
-        if not isinstance(element, exp.ColumnDef):
-            continue
-        constraints = list(element.args.get("constraints") or [])
-        if not constraints:
-            continue
-        filtered = [c for c in constraints if not _is_collate_column_constraint(c)]
-        if filtered != constraints:
-            element.set("constraints", filtered)
+# Column constraint kinds handled by _rewrite_columns, bound once for the inner loop.
+_COLLATE_T = exp.CollateColumnConstraint
+_ON_UPDATE_T = exp.OnUpdateColumnConstraint
+_AUTO_INCREMENT_T = exp.AutoIncrementColumnConstraint
+
+# DataType.build() parses its argument on every call; parse once and copy per use
+# (each node needs its own parent in the tree).
+_PG_BIGINT = exp.DataType.build("BIGINT")
+_PG_NUMERIC_20 = exp.DataType.build("NUMERIC(20, 0)")
 
 
-def _strip_on_update_constraints(schema: exp.Schema) -> List[str]:
-    """Remove MySQL ON UPDATE column constraints and return TODO messages."""
+def _rewrite_columns(schema: exp.Schema) -> List[str]:
+    """Make MySQL column definitions executable in PostgreSQL in a single pass.
+
+    For every column:
+      - drop COLLATE constraints (often MySQL-specific names)
+      - drop ON UPDATE constraints and return a TODO message for each
+      - rewrite AUTO_INCREMENT into IDENTITY
+      - rewrite UNSIGNED integer pseudo-types (UINT -> BIGINT, UBIGINT -> NUMERIC(20, 0)),
+        which sqlglot may emit but PostgreSQL doesn't support as native types
+    """
     todos: List[str] = []
 
-    for element in list(schema.expressions or []):
+    for element in schema.expressions or ():
         if not isinstance(element, exp.ColumnDef):
             continue
-        constraints = list(element.args.get("constraints") or [])
-        if not constraints:
-            continue
-
-        had_on_update = any(_is_on_update_column_constraint(c) for c in constraints)
-        if not had_on_update:
-            continue
-
-        filtered = [c for c in constraints if not _is_on_update_column_constraint(c)]
-        element.set("constraints", filtered)
-
-        col_name = element.this.sql(dialect="postgres")
-        todos.append(
-            f"-- TODO: column {col_name} used MySQL 'ON UPDATE CURRENT_TIMESTAMP'; implement via trigger in PostgreSQL"
-        )
-
-    return todos
 
+        kind = element.args.get("kind")
+        if isinstance(kind, exp.DataType):
+            if kind.this == exp.DataType.Type.UINT:
+                element.set("kind", _PG_BIGINT.copy())
+            elif kind.this == exp.DataType.Type.UBIGINT:
+                element.set("kind", _PG_NUMERIC_20.copy())
 
-def _rewrite_auto_increment_to_identity(schema: exp.Schema) -> None:
-    """Rewrite MySQL AUTO_INCREMENT into PostgreSQL IDENTITY."""
-    for element in list(schema.expressions or []):
-        if not isinstance(element, exp.ColumnDef):
-            continue
-        constraints = list(element.args.get("constraints") or [])
+        constraints = element.args.get("constraints")
         if not constraints:
             continue
 
-        if not any(_is_auto_increment_column_constraint(c) for c in constraints):
-            continue
-
-        filtered = [c for c in constraints if not _is_auto_increment_column_constraint(c)]
-        filtered.append(exp.ColumnConstraint(kind=exp.GeneratedAsIdentityColumnConstraint()))
-        element.set("constraints", filtered)
-
+        filtered: List[exp.Expression] = []
+        had_on_update = False
+        had_auto_increment = False
+        for c in constraints:
+            c_kind = c.args.get("kind")
+            if isinstance(c_kind, _COLLATE_T):
+                continue
+            if isinstance(c_kind, _ON_UPDATE_T):
+                had_on_update = True
+                continue
+            if isinstance(c_kind, _AUTO_INCREMENT_T):
+                had_auto_increment = True
+                continue
+            filtered.append(c)
 
-def _rewrite_unsigned_integer_types(schema: exp.Schema) -> None:
-    """Rewrite MySQL UNSIGNED integer pseudo-types to PostgreSQL-valid types.
+        if had_auto_increment:
+            filtered.append(exp.ColumnConstraint(kind=exp.GeneratedAsIdentityColumnConstraint()))
+        if len(filtered) != len(constraints) or had_auto_increment:
+            element.set("constraints", filtered)
 
-    sqlglot may emit UINT/UBIGINT which PostgreSQL doesn't support as native types.
-    We map:
-      - UINT -> BIGINT
-      - UBIGINT -> NUMERIC(20, 0)
-    """
-    for element in list(schema.expressions or []):
-        if not isinstance(element, exp.ColumnDef):
-            continue
-        kind = element.args.get("kind")
-        if not isinstance(kind, exp.DataType):
-            continue
+        if had_on_update:
+            col_name = _pg(element.this)
+            todos.append(
+                f"-- TODO: column {col_name} used MySQL 'ON UPDATE CURRENT_TIMESTAMP'; implement via trigger in PostgreSQL"
+            )
 
-        dt = kind
-        if dt.this == exp.DataType.Type.UINT:
-            element.set("kind", exp.DataType.build("BIGINT"))
-        elif dt.this == exp.DataType.Type.UBIGINT:
-            element.set("kind", exp.DataType.build("NUMERIC(20, 0)"))
+    return todos
 
 
 def _rewrite_unique_constraints(schema: exp.Schema) -> None:
@@ -128,9 +141,16 @@ def _rewrite_unique_constraints(schema: exp.Schema) -> None:
     sqlglot may render MySQL unique keys as `UNIQUE "name" (col)` inside CREATE TABLE,
     which is not valid PostgreSQL. PostgreSQL expects `CONSTRAINT name UNIQUE (col)`.
     """
+    # Most tables have no named UNIQUE KEY; don't rebuild the list for nothing.
+    if not any(
+        isinstance(e, exp.UniqueColumnConstraint) and isinstance(e.this, exp.Schema)
+        for e in schema.expressions or ()
+    ):
+        return
+
     rewritten: List[exp.Expression] = []
 
-    for element in list(schema.expressions or []):
+    for element in schema.expressions or ():
         if isinstance(element, exp.UniqueColumnConstraint) and isinstance(element.this, exp.Schema):
             unique_schema = element.this
             constraint_name = unique_schema.this
@@ -144,86 +164,97 @@ def _rewrite_unique_constraints(schema: exp.Schema) -> None:
     schema.set("expressions", rewritten)
 
 
+def _quote_ident(name: str) -> str:
+    # PostgreSQL quoted identifier: wrap in double quotes, double any embedded ones.
+    return '"' + name.replace('"', '""') + '"'
+
+
 def _index_column_sql(expression: exp.Expression) -> str:
     # sqlglot represents index columns as Ordered(...) and may include NULLS FIRST.
     # PostgreSQL requires ASC/DESC to use NULLS FIRST/LAST, so we drop NULLS ordering.
+    # Called once per index column, so skip the _pg() wrapper frame.
     if isinstance(expression, exp.Ordered):
-        base = expression.this.sql(dialect="postgres")
+        base = _PG_GENERATE(expression.this, copy=False)
         if expression.args.get("desc"):
             return f"{base} DESC"
         if expression.args.get("asc"):
             return f"{base} ASC"
         return base
-    return expression.sql(dialect="postgres")
-
-
-def _format_identifier_or_column_for_tsvector(expr: exp.Expression) -> str:
-    # Expect Identifier/Column; fall back to expression SQL.
-    base = expr.sql(dialect="postgres")
-    return f"COALESCE({base}::text, '')"
+    return _PG_GENERATE(expression, copy=False)
 
 
 def _fulltext_gin_expression(columns: List[exp.Expression]) -> str:
     # Concatenate columns with spaces to approximate MySQL FULLTEXT behavior.
-    if not columns:
-        return "''"
-    if len(columns) == 1:
-        return _format_identifier_or_column_for_tsvector(columns[0])
-    parts = [f"{_format_identifier_or_column_for_tsvector(c)}" for c in columns]
-    return " || ' ' || ".join(parts)
+    # Each column becomes COALESCE(<col>::text, ''); an empty column list yields ''.
+    parts = ["COALESCE(" + _PG_GENERATE(c, copy=False) + "::text, '')" for c in columns]
+    return " || ' ' || ".join(parts) or "''"
 
 
 def _commented_sql_block(todo: str, original_sql: str) -> str:
-    lines = [f"-- TODO: {todo}"]
+    buf = io.StringIO()
+    buf.write("-- TODO: ")
+    buf.write(todo)
+    buf.write("\n")
     for line in original_sql.strip().splitlines():
-        lines.append(f"-- {line}")
-    return "\n".join(lines).rstrip() + "\n"
+        buf.write("-- ")
+        buf.write(line)
+        buf.write("\n")
+    return buf.getvalue()
 
 
 def _convert_create_table_to_postgres_executable(create: exp.Create) -> str:
     schema = create.this
     if not isinstance(schema, exp.Schema):
-        return create.sql(dialect="postgres") + ";\n"
+        return _pg(create) + ";\n"
 
-    # Remove MySQL-only table properties (ENGINE/CHARSET/COLLATE...)
-    create = create.copy()
+    # Remove MySQL-only table properties (ENGINE/CHARSET/COLLATE...).
+    # The statement is consumed once, so mutate it in place rather than deep-copying.
+    properties = create.args.get("properties")
     create.set("properties", None)
 
-    schema = create.this
-    assert isinstance(schema, exp.Schema)
-    table_sql = schema.this.sql(dialect="postgres")
-
     # Extract inline indexes into standalone CREATE INDEX statements.
     # Keep PRIMARY KEY and UNIQUE KEY in the CREATE TABLE as constraints.
     extracted_indexes: List[exp.IndexColumnConstraint] = []
     retained: List[exp.Expression] = []
-    for element in list(schema.expressions or []):
+    for element in schema.expressions or ():
         if isinstance(element, exp.IndexColumnConstraint):
             extracted_indexes.append(element)
         else:
             retained.append(element)
-    schema.set("expressions", retained)
+    if extracted_indexes:
+        schema.set("expressions", retained)
 
-    # Drop column-level COLLATE constraints (often MySQL-specific names).
-    _strip_column_collations(schema)
+    # Only CREATE INDEX needs the table name. Render it before the CREATE TABLE render,
+    # which is done without copying and may rewrite nodes.
+    table_sql = _pg(schema.this) if extracted_indexes else ""
 
     # Make MySQL column modifiers executable in PostgreSQL.
-    on_update_todos = _strip_on_update_constraints(schema)
-    _rewrite_auto_increment_to_identity(schema)
-    _rewrite_unsigned_integer_types(schema)
+    on_update_todos = _rewrite_columns(schema)
 
     # Rewrite UNIQUE KEY into CONSTRAINT ... UNIQUE (...)
     _rewrite_unique_constraints(schema)
 
-    statements: List[str] = []
-    statements.append(create.sql(dialect="postgres").rstrip() + ";")
-    statements.extend(on_update_todos)
+    buf = io.StringIO()
+    buf.write(_pg(create).rstrip())
+    buf.write(";\n")
+    create.set("properties", properties)
+    for todo in on_update_todos:
+        buf.write(todo)
+        buf.write("\n")
 
     for index in extracted_indexes:
         idx_kind = index.args.get("kind")
+        if index.this is None:
+            # Unnamed `KEY (col)`: PostgreSQL generates an index name when it is omitted.
+            create_index_sql = "CREATE INDEX"
+        elif idx_kind == "FULLTEXT":
+            create_index_sql = f"CREATE INDEX {_quote_ident(str(getattr(index.this, 'this', '')))}"
+        else:
+            idx_name = getattr(index.this, "this", None) or _mysql(index.this)
+            create_index_sql = f"CREATE INDEX {_quote_ident(str(idx_name))}"
+
         if idx_kind == "FULLTEXT":
-            idx_name = getattr(index.this, "this", "")
-            cols = list(index.args.get("expressions") or [])
+            cols = index.args.get("expressions") or ()
             col_exprs: List[exp.Expression] = []
             for c in cols:
                 if isinstance(c, exp.Ordered):
@@ -231,193 +262,549 @@ def _convert_create_table_to_postgres_executable(create: exp.Create) -> str:
                 else:
                     col_exprs.append(c)
 
-            idx_name_sql = exp.to_identifier(str(idx_name), quoted=True).sql(dialect="postgres")
             gin_expr = _fulltext_gin_expression(col_exprs)
             # Default to 'simple'. Users can adjust language based on needs.
-            statements.append(
-                f"CREATE INDEX {idx_name_sql} ON {table_sql} USING GIN (to_tsvector('simple', {gin_expr}));"
+            buf.write(
+                f"{create_index_sql} ON {table_sql} USING GIN (to_tsvector('simple', {gin_expr}));\n"
             )
             continue
 
-        idx_name = getattr(index.this, "this", None) or index.this.sql(dialect="mysql")
-        idx_name_sql = exp.to_identifier(str(idx_name), quoted=True).sql(dialect="postgres")
-
-        cols = list(index.args.get("expressions") or [])
-        cols_sql = ", ".join(_index_column_sql(c) for c in cols)
+        cols = index.args.get("expressions") or ()
+        cols_sql = ", ".join(map(_index_column_sql, cols))
 
         using_clause = ""
         index_type = index.args.get("index_type")
         if isinstance(index_type, exp.Expression):
-            index_type = index_type.sql(dialect="postgres")
+            index_type = _pg(index_type)
         if isinstance(index_type, str) and index_type and index_type.upper() == "HASH":
             using_clause = " USING hash"
 
         # Some MySQL syntax like `USING HASH` is stored in options rather than index_type.
-        for opt in list(index.args.get("options") or []):
-            using = getattr(opt, "args", {}).get("using")
+        for opt in index.args.get("options") or ():
+            using = opt.args.get("using")
             if isinstance(using, str) and using.upper() == "HASH":
                 using_clause = " USING hash"
 
-        statements.append(f"CREATE INDEX {idx_name_sql} ON {table_sql}{using_clause} ({cols_sql});")
+        buf.write(f"{create_index_sql} ON {table_sql}{using_clause} ({cols_sql});\n")
 
-    return "\n".join(statements).rstrip() + "\n"
+    return buf.getvalue()
 
 
-def convert_mysql_to_postgres(mysql_sql_text: str) -> List[ConversionResult]:
-    """Convert MySQL SQL text (possibly multiple statements) into PostgreSQL.
+def _handle_command(expression: exp.Command) -> str:
+    # sqlglot may fall back to Command for unsupported syntax. Do not emit raw MySQL.
+    return _commented_sql_block(
+        "Unsupported MySQL-specific syntax; manual rewrite required", _mysql(expression)
+    )
 
-    Returns a list of statement-level results.
-    """
+
+def _handle_create(expression: exp.Create) -> str:
+    if expression.args.get("kind") != "TABLE":
+        return _handle_default(expression)
+    return _convert_create_table_to_postgres_executable(expression)
+
+
+def _handle_delete(expression: exp.Delete) -> str:
+    if expression.args.get("limit") is None:
+        return _handle_default(expression)
+
+    # Rewrite DELETE ... LIMIT N into ctid-based delete, which is executable in PG.
+    delete = expression
+    table = _pg(delete.this)
+    where = delete.args.get("where")
+    where_sql = (
+        _pg(where.this)
+        if isinstance(where, exp.Where) and where.this is not None
+        else "TRUE"
+    )
+    limit = delete.args.get("limit")
+    limit_sql = (
+        _pg(limit.expression)
+        if isinstance(limit, exp.Limit) and limit.expression is not None
+        else "0"
+    )
+    order = delete.args.get("order")
+    order_sql = _pg(order) if order is not None else ""
+    if order_sql:
+        order_sql = " " + order_sql
+    return (
+        f"DELETE FROM {table} WHERE ctid IN ("
+        f"SELECT ctid FROM {table} WHERE {where_sql}{order_sql} LIMIT {limit_sql}"
+        f");\n"
+    )
+
+
+def _handle_update(expression: exp.Update) -> str:
+    if not isinstance(expression.this, exp.Table):
+        return _handle_default(expression)
+
+    # Rewrite MySQL UPDATE ... JOIN ... SET ... to PostgreSQL UPDATE ... SET ... FROM ... WHERE ...
+    update = expression
+    target = update.this
+    joins = target.args.get("joins") or []
+    if not joins:
+        return _pg(update).rstrip() + ";\n"
+
+    target_alias = None
+    alias = target.args.get("alias")
+    if alias is not None and getattr(alias, "this", None) is not None:
+        target_alias = alias.this.this
+
+    # Remove joins from target.
+    target.set("joins", None)
+
+    from_tables: List[str] = []
+    conditions: List[str] = []
+    for j in joins:
+        from_tables.append(_pg(j.this))
+        on = j.args.get("on")
+        if on is not None:
+            conditions.append(_pg(on))
+
+    # Include additional WHERE if present (rare for this MySQL form)
+    where = update.args.get("where")
+    if isinstance(where, exp.Where) and where.this is not None:
+        conditions.append(_pg(where.this))
+
+    # Strip target alias from SET columns (PG doesn't allow u.col in SET)
+    # The statement is consumed once, so only aliased columns are touched, in place.
+    rewritten_sets: List[str] = []
+    append_set = rewritten_sets.append
+    for assignment in update.expressions or ():
+        column = assignment.this
+        if (
+            target_alias
+            and isinstance(assignment, exp.EQ)
+            and isinstance(column, exp.Column)
+            and column.table == target_alias
+        ):
+            column.set("table", None)
+        append_set(_pg(assignment))
+
+    from_sql = ", ".join(from_tables)
+    where_sql = " AND ".join(conditions) if conditions else "TRUE"
+    return (
+        f"UPDATE {_pg(target)} SET {', '.join(rewritten_sets)} "
+        f"FROM {from_sql} WHERE {where_sql};\n"
+    )
+
+
+def _handle_insert(expression: exp.Insert) -> str:
+    if not expression.args.get("ignore"):
+        return _handle_default(expression)
+
+    # MySQL INSERT IGNORE ~= PostgreSQL ON CONFLICT DO NOTHING
+    insert = expression
+    insert.set("ignore", None)
+    postgres_sql = _pg(insert).rstrip()
+    # Ensure it ends with ON CONFLICT DO NOTHING.
+    if "ON CONFLICT" not in postgres_sql.upper():
+        postgres_sql = postgres_sql.rstrip(";") + " ON CONFLICT DO NOTHING"
+    return postgres_sql.rstrip() + ";\n"
+
+
+def _unix_ts_rewrite(node: exp.Expression) -> exp.Expression:
+    if isinstance(node, exp.Anonymous) and node.name.upper() == "UNIX_TIMESTAMP":
+        args = node.expressions
+        inner = args[0] if args else exp.CurrentTimestamp()
+        return exp.Cast(
+            this=exp.Extract(this="EPOCH", expression=inner),
+            to=_PG_BIGINT.copy(),
+        )
+    return node
+
+
+# MySQL-only constructs detected in the rendered MySQL text of a fallback statement.
+_TRIGGER_UNIX_TIMESTAMP = 1
+_TRIGGER_ON_DUPLICATE_KEY = 2
+_TRIGGER_REPLACE = 4
+
+
+def _build_trigger_db() -> Any:
+    # One multi-pattern DFA scan instead of an uppercase copy plus three substring scans.
+    if hyperscan is None:
+        return None
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[b"UNIX_TIMESTAMP", b"ON DUPLICATE KEY", rb"^\s*REPLACE "],
+        ids=[_TRIGGER_UNIX_TIMESTAMP, _TRIGGER_ON_DUPLICATE_KEY, _TRIGGER_REPLACE],
+        elements=3,
+        flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+    )
+    return db
+
+
+_TRIGGER_DB = _build_trigger_db()
+
+
+def _mysql_triggers(mysql_sql: str) -> int:
+    """Return the `_TRIGGER_*` bits whose construct appears in `mysql_sql` (case-insensitive)."""
+    found = 0
+    if _TRIGGER_DB is None:
+        upper_mysql = mysql_sql.upper()
+        if "UNIX_TIMESTAMP" in upper_mysql:
+            found |= _TRIGGER_UNIX_TIMESTAMP
+        if "ON DUPLICATE KEY" in upper_mysql:
+            found |= _TRIGGER_ON_DUPLICATE_KEY
+        if upper_mysql.lstrip().startswith("REPLACE "):
+            found |= _TRIGGER_REPLACE
+        return found
+
+    def _on_match(pattern_id: int, start: int, end: int, flags: int, context: Any) -> None:
+        nonlocal found
+        found |= pattern_id
+
+    _TRIGGER_DB.scan(mysql_sql.encode("utf-8"), match_event_handler=_on_match)
+    return found
+
+
+def _handle_default(expression: exp.Expression) -> str:
+    # Detect constructs that often require schema knowledge (REPLACE, ON DUPLICATE KEY UPDATE)
+    # Render MySQL once and reuse it for the construct scan and the TODO block.
+    mysql_sql = _mysql(expression)
+    triggers = _mysql_triggers(mysql_sql)
+    if triggers & (_TRIGGER_ON_DUPLICATE_KEY | _TRIGGER_REPLACE):
+        return _commented_sql_block(
+            "Cannot reliably convert without knowing conflict target/constraints; consider ON CONFLICT",
+            mysql_sql.rstrip(";") + ";",
+        )
+
+    # Rewrite UNIX_TIMESTAMP() (MySQL) to EXTRACT(EPOCH FROM ...) (PostgreSQL).
+    # The statement is consumed once, so transform it in place.
+    if triggers & _TRIGGER_UNIX_TIMESTAMP:
+        expression = expression.transform(_unix_ts_rewrite, copy=False)
+
+    # If sqlglot can transpile, use it.
+    return _pg(expression).rstrip() + ";\n"
+
+
+# Exact-type dispatch for the per-statement loop; handlers fall back to
+# _handle_default when their secondary check (kind, LIMIT, ...) does not apply.
+_HANDLERS: Dict[type, Callable[[Any], str]] = {
+    exp.Command: _handle_command,
+    exp.Create: _handle_create,
+    exp.Delete: _handle_delete,
+    exp.Update: _handle_update,
+    exp.Insert: _handle_insert,
+}
+
+
+def _convert_expression(expression: Optional[exp.Expression]) -> ConversionResult:
+    if expression is None:
+        # sqlglot yields None for empty / comment-only statements (e.g. "SELECT 1;;").
+        return ConversionResult(postgres_sql=None, error="empty statement")
+    try:
+        handler = _HANDLERS.get(type(expression), _handle_default)
+        return ConversionResult(postgres_sql=handler(expression))
+    except Exception as exc:  # noqa: BLE001 - surface error message to user
+        return ConversionResult(
+            postgres_sql=None,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+
+
+def _convert_text(mysql_sql_text: str) -> List[ConversionResult]:
     mysql_sql_text = _preprocess_mysql_sql(mysql_sql_text)
     expressions = sqlglot.parse(mysql_sql_text, read="mysql")
-    results: List[ConversionResult] = []
+    return [_convert_expression(expression) for expression in expressions]
 
-    for expression in expressions:
-        try:
-            # sqlglot may fall back to Command for unsupported syntax. Do not emit raw MySQL.
-            if isinstance(expression, exp.Command):
-                raw = expression.sql(dialect="mysql")
-                results.append(
-                    ConversionResult(
-                        postgres_sql=_commented_sql_block(
-                            "Unsupported MySQL-specific syntax; manual rewrite required", raw
-                        )
-                    )
-                )
-                continue
 
-            if isinstance(expression, exp.Create) and expression.args.get("kind") == "TABLE":
-                postgres_sql = _convert_create_table_to_postgres_executable(expression)
-            elif isinstance(expression, exp.Delete) and expression.args.get("limit") is not None:
-                # Rewrite DELETE ... LIMIT N into ctid-based delete, which is executable in PG.
-                delete = expression
-                table = delete.this.sql(dialect="postgres")
-                where = delete.args.get("where")
-                where_sql = (
-                    where.this.sql(dialect="postgres")
-                    if isinstance(where, exp.Where) and where.this is not None
-                    else "TRUE"
-                )
-                limit = delete.args.get("limit")
-                limit_sql = (
-                    limit.expression.sql(dialect="postgres")
-                    if isinstance(limit, exp.Limit) and limit.expression is not None
-                    else "0"
-                )
-                order = delete.args.get("order")
-                order_sql = order.sql(dialect="postgres") if order is not None else ""
-                if order_sql:
-                    order_sql = " " + order_sql
-                postgres_sql = (
-                    f"DELETE FROM {table} WHERE ctid IN ("
-                    f"SELECT ctid FROM {table} WHERE {where_sql}{order_sql} LIMIT {limit_sql}"
-                    f");\n"
-                )
-            elif isinstance(expression, exp.Update) and isinstance(expression.this, exp.Table):
-                # Rewrite MySQL UPDATE ... JOIN ... SET ... to PostgreSQL UPDATE ... SET ... FROM ... WHERE ...
-                update = expression.copy()
-                target = update.this
-                joins = list(getattr(target, "args", {}).get("joins") or [])
-                if joins:
-                    target_alias = None
-                    alias = target.args.get("alias")
-                    if alias is not None and getattr(alias, "this", None) is not None:
-                        target_alias = alias.this.this
-
-                    # Remove joins from target.
-                    target.set("joins", None)
-
-                    from_tables: List[str] = []
-                    conditions: List[str] = []
-                    for j in joins:
-                        from_tables.append(j.this.sql(dialect="postgres"))
-                        on = j.args.get("on")
-                        if on is not None:
-                            conditions.append(on.sql(dialect="postgres"))
-
-                    # Include additional WHERE if present (rare for this MySQL form)
-                    where = update.args.get("where")
-                    if isinstance(where, exp.Where) and where.this is not None:
-                        conditions.append(where.this.sql(dialect="postgres"))
-
-                    # Strip target alias from SET columns (PG doesn't allow u.col in SET)
-                    rewritten_sets: List[str] = []
-                    for assignment in list(update.expressions or []):
-                        a = assignment.copy()
-                        if isinstance(a, exp.EQ) and isinstance(a.this, exp.Column):
-                            if target_alias and a.this.table and a.this.table == target_alias:
-                                a.this.set("table", None)
-                        rewritten_sets.append(a.sql(dialect="postgres"))
-
-                    from_sql = ", ".join(from_tables)
-                    where_sql = " AND ".join(conditions) if conditions else "TRUE"
-                    postgres_sql = (
-                        f"UPDATE {target.sql(dialect='postgres')} SET {', '.join(rewritten_sets)} "
-                        f"FROM {from_sql} WHERE {where_sql};\n"
-                    )
-                else:
-                    postgres_sql = update.sql(dialect="postgres").rstrip() + ";\n"
-            elif isinstance(expression, exp.Insert) and bool(expression.args.get("ignore")):
-                # MySQL INSERT IGNORE ~= PostgreSQL ON CONFLICT DO NOTHING
-                insert = expression.copy()
-                insert.set("ignore", None)
-                postgres_sql = insert.sql(dialect="postgres").rstrip()
-                # Ensure it ends with ON CONFLICT DO NOTHING.
-                if "ON CONFLICT" not in postgres_sql.upper():
-                    postgres_sql = postgres_sql.rstrip(";") + " ON CONFLICT DO NOTHING"
-                postgres_sql = postgres_sql.rstrip() + ";\n"
-            else:
-                # If sqlglot can transpile, use it.
-                postgres_sql = expression.sql(dialect="postgres").rstrip() + ";\n"
-
-                # Rewrite UNIX_TIMESTAMP() (MySQL) to EXTRACT(EPOCH FROM ...) (PostgreSQL)
-                if "UNIX_TIMESTAMP" in expression.sql(dialect="mysql").upper():
-                    def _unix_ts_rewrite(node: exp.Expression) -> exp.Expression:
-                        if isinstance(node, exp.Anonymous) and node.name.upper() == "UNIX_TIMESTAMP":
-                            args = list(node.expressions or [])
-                            inner = args[0] if args else exp.CurrentTimestamp()
-                            return exp.Cast(
-                                this=exp.Extract(this="EPOCH", expression=inner),
-                                to=exp.DataType.build("BIGINT"),
-                            )
-                        return node
-
-                    rewritten = expression.copy().transform(_unix_ts_rewrite)
-                    postgres_sql = rewritten.sql(dialect="postgres").rstrip() + ";\n"
-
-                # Detect constructs that often require schema knowledge (REPLACE, ON DUPLICATE KEY UPDATE)
-                upper_mysql = expression.sql(dialect="mysql").upper()
-                if "ON DUPLICATE KEY" in upper_mysql or upper_mysql.startswith("REPLACE "):
-                    postgres_sql = _commented_sql_block(
-                        "Cannot reliably convert without knowing conflict target/constraints; consider ON CONFLICT",
-                        expression.sql(dialect="mysql").rstrip(";") + ";",
-                    )
-
-            results.append(ConversionResult(postgres_sql=postgres_sql))
-        except Exception as exc:  # noqa: BLE001 - surface error message to user
-            results.append(
-                ConversionResult(
-                    postgres_sql=None,
-                    error=f"{type(exc).__name__}: {exc}",
-                )
-            )
+def convert_mysql_to_postgres(mysql_sql_text: str, parallel: bool = False) -> List[ConversionResult]:
+    """Convert MySQL SQL text (possibly multiple statements) into PostgreSQL.
 
+    Returns a list of statement-level results. Statements that cannot be parsed or converted
+    are returned as results with `error` set; parse errors are not raised.
+    With `parallel`, the text is split with `iter_statements` and converted through
+    `convert_mysql_statements`, which may use a process pool.
+    """
+    if parallel:
+        # Split the raw text and let the streaming path hand statements to the pool;
+        # parsing and re-rendering everything here first would cost most of a serial run.
+        return list(convert_mysql_statements(iter_statements(io.StringIO(mysql_sql_text))))
+
+    try:
+        return _convert_text(mysql_sql_text)
+    except (ParseError, TokenError):
+        # Re-parse statement by statement so only the bad ones become errors.
+        return _convert_batch(list(iter_statements(io.StringIO(mysql_sql_text))), 0)
+
+
+def _parse_error_result(exc: Exception, line_offset: int) -> ConversionResult:
+    """One-line `-- ERROR` result for an unparsable statement, with line numbers in file terms."""
+    errors = getattr(exc, "errors", None)
+    if errors:
+        message = "; ".join(
+            f"{error['description']}. Line {error['line'] + line_offset}, Col: {error['col']}."
+            for error in errors
+        )
+    else:
+        # The full message quotes the statement (with ANSI highlighting); keep the first line.
+        message = str(exc).split("\n", 1)[0]
+    return ConversionResult(postgres_sql=None, error=f"{type(exc).__name__}: {message}")
+
+
+def _convert_batch(statements: List[str], line_offset: int) -> List[ConversionResult]:
+    """Process-pool worker for `convert_mysql_statements`.
+
+    `line_offset` is the number of input lines before the batch. If the batch does not parse,
+    it is re-parsed statement by statement so one bad statement does not take the others down.
+    """
+    try:
+        return _convert_text("".join(statements))
+    except (ParseError, TokenError):
+        pass
+
+    # Keep comment-only statements with the statement before them, as `_iter_batches` does.
+    units: List[str] = []
+    for statement in statements:
+        if units and _is_comment_only(statement):
+            units[-1] += statement
+        else:
+            units.append(statement)
+
+    results: List[ConversionResult] = []
+    for unit in units:
+        try:
+            results.extend(_convert_text(unit))
+        except (ParseError, TokenError) as exc:
+            results.append(_parse_error_result(exc, line_offset))
+        line_offset += unit.count("\n")
     return results
 
 
+def _is_comment_only(statement: str) -> bool:
+    return _COMMENT_ONLY_RE.fullmatch(statement) is not None
+
+
+def _iter_batches(statements: Iterable[str], size: int) -> Iterator[Tuple[List[str], int]]:
+    """Group statements into lists of about `size`, each with the number of input lines before it.
+
+    sqlglot places a comment-only statement (e.g. mysqldump's `/*!40101 SET ... */;`)
+    differently depending on the statement before it, so a batch never starts with one.
+    """
+    batch: List[str] = []
+    line_offset = 0
+    for statement in statements:
+        if len(batch) >= size and not _is_comment_only(statement):
+            yield batch, line_offset
+            line_offset += sum(chunk.count("\n") for chunk in batch)
+            batch = []
+        batch.append(statement)
+    if batch:
+        yield batch, line_offset
+
+
+def _available_cpus() -> int:
+    # cpu_count() reports host cores inside containers; prefer the CPUs we may run on.
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def convert_mysql_statements(statements: Iterable[str]) -> Iterator[ConversionResult]:
+    """Convert MySQL statement texts (e.g. from `iter_statements`) lazily, in input order.
+
+    Statements are converted in batches of `_STREAM_BATCH_STATEMENTS`. Inputs of at most
+    `_PARALLEL_MIN_STATEMENTS` statements, or hosts with a single usable CPU, stay in-process;
+    otherwise the batches go to a process pool with a bounded number in flight, so memory
+    stays flat. If no pool can be started, the remaining batches are converted serially.
+    A statement sqlglot cannot parse becomes an error result instead of ending the stream.
+    """
+    batches = _iter_batches(statements, _STREAM_BATCH_STATEMENTS)
+    # Look ahead far enough to know whether a pool would pay for its startup.
+    head: List[Tuple[List[str], int]] = []
+    buffered = 0
+    for batch in batches:
+        head.append(batch)
+        buffered += len(batch[0])
+        if buffered > _PARALLEL_MIN_STATEMENTS:
+            break
+
+    workers = _available_cpus()
+    queued = itertools.chain(head, batches)
+    pending: Deque[Tuple[Tuple[List[str], int], Future[List[ConversionResult]]]] = deque()
+    unsent: Optional[Tuple[List[str], int]] = None
+    if buffered > _PARALLEL_MIN_STATEMENTS and workers > 1:
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                for batch in queued:
+                    unsent = batch
+                    pending.append((batch, executor.submit(_convert_batch, *batch)))
+                    unsent = None
+                    if len(pending) >= 2 * workers:
+                        yield from pending[0][1].result()
+                        pending.popleft()
+                while pending:
+                    yield from pending[0][1].result()
+                    pending.popleft()
+            return
+        except (OSError, BrokenProcessPool):
+            # No usable process pool here (e.g. sandboxed); finish from the first batch not yet emitted.
+            pass
+
+    for batch, _ in pending:
+        yield from _convert_batch(*batch)
+    if unsent is not None:
+        yield from _convert_batch(*unsent)
+    for batch in queued:
+        yield from _convert_batch(*batch)
+
+
 def format_plain_sql_output(results: Iterable[ConversionResult]) -> str:
-    """Format conversion results as plain PostgreSQL SQL statements.
+    """Format conversion results as plain PostgreSQL SQL statements (see `write_plain_sql_output`)."""
+    buf = io.StringIO()
+    write_plain_sql_output(results, buf)
+    return buf.getvalue()
+
+
+# Statement splitter states. Quote states are keyed by their quote character.
+_SPLIT_CODE = "code"
+_SPLIT_BLOCK = "block"
+_SPLIT_TRAILER = "trailer"
+
+_SPLIT_CODE_RE = re.compile(r"""[;'"`#]|--|/\*""")
+# Rest of a quoted string/identifier up to and including its closing quote. A doubled
+# quote simply closes and reopens, so it needs no special case.
+_SPLIT_QUOTE_RE = {
+    "'": re.compile(r"[^'\\]*(?:\\.[^'\\]*)*'", flags=re.DOTALL),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', flags=re.DOTALL),
+    "`": re.compile(r"[^`]*`"),
+}
+_SPLIT_BLANK_RE = re.compile(r"[ \t\r\f\v]*")
+# A statement with nothing but comments, whitespace and its ';'.
+# Each alternative matches one way only, so failing on a long statement cannot backtrack.
+_COMMENT_ONLY_RE = re.compile(r"(?:\s|;|/\*(?:[^*]|\*(?!/))*\*/|(?:--|#)[^\n]*(?![^\n]))*")
+
+
+def iter_statements(fp: TextIO) -> Iterator[str]:
+    """Split MySQL SQL read from `fp` into statements at top-level ';', lazily.
+
+    Quoted strings/identifiers and comments are respected. Comments starting on the same
+    line after a ';' stay with that statement and trailing comment-only text is merged into
+    the last statement, which is where sqlglot attaches them when parsing a whole file.
+    Concatenating the yielded chunks gives back the input text.
+    """
+    state = _SPLIT_CODE
+    block_return = _SPLIT_CODE
+    parts: List[str] = []
+    has_code = False
+    pending: Optional[str] = None
+
+    for line in fp:
+        n = len(line)
+        pos = 0
+        start = 0
+        completed: List[str] = []
+
+        while pos < n:
+            if state == _SPLIT_CODE:
+                m = _SPLIT_CODE_RE.search(line, pos)
+                end = n if m is None else m.start()
+                if not has_code and line[pos:end].strip():
+                    has_code = True
+                if m is None:
+                    pos = n
+                    continue
+                token = m.group()
+                pos = m.end()
+                if token == ";":
+                    has_code = True
+                    state = _SPLIT_TRAILER
+                elif token == "/*":
+                    state = _SPLIT_BLOCK
+                    block_return = _SPLIT_CODE
+                elif token in _SPLIT_QUOTE_RE:
+                    has_code = True
+                    state = token
+                else:
+                    # `--` or `#` line comment.
+                    pos = n
+            elif state == _SPLIT_BLOCK:
+                end = line.find("*/", pos)
+                if end == -1:
+                    pos = n
+                else:
+                    pos = end + 2
+                    state = block_return
+            elif state == _SPLIT_TRAILER:
+                pos = _SPLIT_BLANK_RE.match(line, pos).end()
+                if line.startswith("/*", pos):
+                    pos += 2
+                    state = _SPLIT_BLOCK
+                    block_return = _SPLIT_TRAILER
+                    continue
+                if pos >= n or line.startswith(("--", "#", "\n"), pos):
+                    pos = n
+                parts.append(line[start:pos])
+                completed.append("".join(parts))
+                parts = []
+                start = pos
+                has_code = False
+                state = _SPLIT_CODE
+            else:
+                m = _SPLIT_QUOTE_RE[state].match(line, pos)
+                if m is None:
+                    pos = n
+                else:
+                    pos = m.end()
+                    state = _SPLIT_CODE
+
+        if start < n:
+            parts.append(line[start:])
+        for statement in completed:
+            if pending is not None:
+                yield pending
+            pending = statement
+
+    tail = "".join(parts)
+    if has_code or state == _SPLIT_TRAILER:
+        if pending is not None:
+            yield pending
+        pending = tail
+    elif tail:
+        pending = tail if pending is None else pending + tail
+    if pending is not None:
+        yield pending
+
+
+def write_plain_sql_output(results: Iterable[ConversionResult], out: TextIO) -> None:
+    """Stream conversion results to `out` as plain PostgreSQL SQL statements.
 
     - Successful statements are emitted as SQL (each ends with ';').
     - Failed statements emit a comment with the error.
     """
-    lines: List[str] = []
+    previous: Optional[str] = None
     for result in results:
         if result.postgres_sql is not None:
-            lines.append(result.postgres_sql.rstrip())
+            text = result.postgres_sql.rstrip()
         else:
-            lines.append(f"-- ERROR: {result.error or 'Unknown error'}")
-    return "\n\n".join(lines).rstrip() + "\n"
+            text = f"-- ERROR: {result.error or 'Unknown error'}"
+        if previous is not None:
+            out.write(previous)
+            out.write("\n\n")
+        previous = text
+    if previous is not None:
+        out.write(previous.rstrip())
+    out.write("\n")
+
+
+def _write_output_file(results: Iterable[ConversionResult], out_path: Path) -> None:
+    """Write results to a temporary file next to `out_path`, then move it into place.
+
+    `results` may still be reading the input lazily, so `out_path` must not be truncated
+    before they are exhausted: it can be the input file itself, and a failed run must not
+    leave a partial file behind.
+    """
+    target = out_path.resolve()
+    tmp_path = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("x", encoding="utf-8") as out:
+            write_plain_sql_output(results, out)
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 
 def _build_arg_parser() -> argparse.ArgumentParser:
@@ -455,11 +842,10 @@ def main(argv: Optional[List[str]] = None) -> int:
             return 2
 
         results = convert_mysql_to_postgres(sql_text)
-        output_text = format_plain_sql_output(results)
         if args.out_file is not None:
-            args.out_file.write_text(output_text, encoding="utf-8")
+            _write_output_file(results, args.out_file)
         else:
-            sys.stdout.write(output_text)
+            write_plain_sql_output(results, sys.stdout)
         return 0
 
     # File mode
@@ -468,15 +854,14 @@ def main(argv: Optional[List[str]] = None) -> int:
         sys.stderr.write(f"Input file not found: {input_path}\n")
         return 2
 
+    # Stream statement by statement so large dumps are never held in memory at once.
     # Use utf-8-sig to gracefully handle UTF-8 BOM (common in Windows/PowerShell outputs)
-    mysql_text = input_path.read_text(encoding="utf-8-sig")
-    results = convert_mysql_to_postgres(mysql_text)
-    output_text = format_plain_sql_output(results)
-
-    if args.out_file is not None:
-        args.out_file.write_text(output_text, encoding="utf-8")
-    else:
-        sys.stdout.write(output_text)
+    with input_path.open("r", encoding="utf-8-sig", buffering=1 << 20) as fp:
+        results = convert_mysql_statements(iter_statements(fp))
+        if args.out_file is not None:
+            _write_output_file(results, args.out_file)
+        else:
+            write_plain_sql_output(results, sys.stdout)
     return 0
 
 
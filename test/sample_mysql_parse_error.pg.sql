@@ -0,0 +1,49 @@
+/* Unparsable statements become -- ERROR comments; line numbers refer to this file. */ INSERT INTO "events" ("id", "name") VALUES (1, 'event 1');
+
+INSERT INTO "events" ("id", "name") VALUES (2, 'event 2');
+
+INSERT INTO "events" ("id", "name") VALUES (3, 'event 3');
+
+INSERT INTO "events" ("id", "name") VALUES (4, 'event 4');
+
+INSERT INTO "events" ("id", "name") VALUES (5, 'event 5');
+
+INSERT INTO "events" ("id", "name") VALUES (6, 'event 6');
+
+INSERT INTO "events" ("id", "name") VALUES (7, 'event 7');
+
+INSERT INTO "events" ("id", "name") VALUES (8, 'event 8');
+
+INSERT INTO "events" ("id", "name") VALUES (9, 'event 9');
+
+INSERT INTO "events" ("id", "name") VALUES (10, 'event 10');
+
+INSERT INTO "events" ("id", "name") VALUES (11, 'event 11');
+
+INSERT INTO "events" ("id", "name") VALUES (12, 'event 12');
+
+INSERT INTO "events" ("id", "name") VALUES (13, 'event 13');
+
+INSERT INTO "events" ("id", "name") VALUES (14, 'event 14');
+
+INSERT INTO "events" ("id", "name") VALUES (15, 'event 15');
+
+INSERT INTO "events" ("id", "name") VALUES (16, 'event 16');
+
+INSERT INTO "events" ("id", "name") VALUES (17, 'event 17');
+
+INSERT INTO "events" ("id", "name") VALUES (18, 'event 18');
+
+INSERT INTO "events" ("id", "name") VALUES (19, 'event 19');
+
+INSERT INTO "events" ("id", "name") VALUES (20, 'event 20');
+
+-- ERROR: ParseError: Required keyword: 'this' missing for <class 'sqlglot.expressions.core.Paren'>. Line 22, Col: 10.
+
+UPDATE "events" SET "name" = 'renamed' WHERE "id" = 1;
+
+-- ERROR: ParseError: Required keyword: 'this' missing for <class 'sqlglot.expressions.query.Where'>. Line 25, Col: 28.
+
+DELETE FROM "events" WHERE ctid IN (SELECT ctid FROM "events" WHERE "id" = 2 LIMIT 1);
+
+-- ERROR: TokenError: Error tokenizing 'vents` (`id`, `name`) VALUES (99, 'unterminated);'
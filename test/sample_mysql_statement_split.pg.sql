@@ -0,0 +1,19 @@
+/* Statement splitting: ';' inside quotes and comments must not end a statement. */ CREATE TABLE "semi;colon" ("id" INT(11) NOT NULL GENERATED AS IDENTITY, "note;text" VARCHAR(255) DEFAULT 'a;b' /* inline; comment */, PRIMARY KEY ("id"));
+
+INSERT INTO "semi;colon" ("note;text") VALUES ('x;y'), ('double;quoted');
+
+/* trailing; comment */;
+
+INSERT INTO "semi;colon" ("note;text") VALUES ('it''s; escaped'), ('say "hi;"');
+
+/* hash; comment */;
+
+/* block comment; with semicolons;
+   spanning lines */ SELECT "id", 'multi-line;
+string; value' AS "v" FROM "semi;colon" WHERE "note;text" <> 'back\slash;';
+
+UPDATE "semi;colon" SET "note;text" = 'a' || ';' || 'b' WHERE "id" = 1;
+
+/* after; */;
+
+DELETE FROM "semi;colon" WHERE ctid IN (SELECT ctid FROM "semi;colon" WHERE "note;text" = '' LIMIT 1);
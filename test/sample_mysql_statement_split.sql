@@ -0,0 +1,14 @@
+-- Statement splitting: ';' inside quotes and comments must not end a statement.
+CREATE TABLE `semi;colon` (
+  `id` int(11) NOT NULL AUTO_INCREMENT,
+  `note;text` varchar(255) DEFAULT 'a;b', /* inline; comment */
+  PRIMARY KEY (`id`)
+) ENGINE=InnoDB;
+INSERT INTO `semi;colon` (`note;text`) VALUES ('x;y'), ("double;quoted"); -- trailing; comment
+INSERT INTO `semi;colon` (`note;text`) VALUES ('it\'s; escaped'), ("say \"hi;\""); # hash; comment
+/* block comment; with semicolons;
+   spanning lines */
+SELECT `id`, 'multi-line;
+string; value' AS `v` FROM `semi;colon` WHERE `note;text` <> 'back\\slash;';
+UPDATE `semi;colon` SET `note;text` = CONCAT('a', ';', "b") WHERE `id` = 1; /* after; */
+DELETE FROM `semi;colon` WHERE `note;text` = '' LIMIT 1;
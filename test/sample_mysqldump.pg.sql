@@ -0,0 +1,137 @@
+-- ERROR: empty statement
+
+/* MySQL dump 10.13  Distrib 8.0.36, for Linux (x86_64) */ /* Host: localhost    Database: shop */ /* ------------------------------------------------------ */ /* Server version	8.0.36 */ /* !40101 SET @OLD_CHARACTER_SET_CLIENT=@@CHARACTER_SET_CLIENT */ /* !40101 SET @OLD_CHARACTER_SET_RESULTS=@@CHARACTER_SET_RESULTS */;
+
+-- ERROR: empty statement
+
+/* !40101 SET @OLD_COLLATION_CONNECTION=@@COLLATION_CONNECTION */;
+
+-- ERROR: empty statement
+
+/* !50503 SET NAMES utf8mb4 */;
+
+-- ERROR: empty statement
+
+/* !40103 SET @OLD_TIME_ZONE=@@TIME_ZONE */;
+
+-- ERROR: empty statement
+
+/* !40103 SET TIME_ZONE='+00:00' */;
+
+-- ERROR: empty statement
+
+/* !40014 SET @OLD_UNIQUE_CHECKS=@@UNIQUE_CHECKS, UNIQUE_CHECKS=0 */;
+
+-- ERROR: empty statement
+
+/* !40014 SET @OLD_FOREIGN_KEY_CHECKS=@@FOREIGN_KEY_CHECKS, FOREIGN_KEY_CHECKS=0 */;
+
+-- ERROR: empty statement
+
+/* !40101 SET @OLD_SQL_MODE=@@SQL_MODE, SQL_MODE='NO_AUTO_VALUE_ON_ZERO' */;
+
+-- ERROR: empty statement
+
+/* !40111 SET @OLD_SQL_NOTES=@@SQL_NOTES, SQL_NOTES=0 */;
+
+-- ERROR: empty statement
+
+/* Table structure for table `users` */ DROP TABLE IF EXISTS "users";
+
+/* !40101 SET @saved_cs_client     = @@character_set_client */;
+
+-- ERROR: empty statement
+
+/* !50503 SET character_set_client = utf8mb4 */;
+
+-- ERROR: empty statement
+
+CREATE TABLE "users" ("id" INT NOT NULL GENERATED AS IDENTITY, "name" VARCHAR(64) DEFAULT NULL, PRIMARY KEY ("id"));
+CREATE INDEX "idx_name" ON "users" ("name");
+
+/* !40101 SET character_set_client = @saved_cs_client */;
+
+-- ERROR: empty statement
+
+-- TODO: Unsupported MySQL-specific syntax; manual rewrite required
+-- /* Dumping data for table `users` */ LOCK TABLES `users` WRITE
+
+/* !40000 ALTER TABLE `users` DISABLE KEYS */;
+
+-- ERROR: empty statement
+
+INSERT INTO "users" VALUES (1, 'a'), (2, 'b;c');
+
+/* !40000 ALTER TABLE `users` ENABLE KEYS */;
+
+-- ERROR: empty statement
+
+-- TODO: Unsupported MySQL-specific syntax; manual rewrite required
+-- UNLOCK TABLES
+
+/* Table structure for table `orders` */ DROP TABLE IF EXISTS "orders";
+
+/* !40101 SET @saved_cs_client     = @@character_set_client */;
+
+-- ERROR: empty statement
+
+/* !50503 SET character_set_client = utf8mb4 */;
+
+-- ERROR: empty statement
+
+CREATE TABLE "orders" ("id" INT NOT NULL GENERATED AS IDENTITY, "name" VARCHAR(64) DEFAULT NULL, PRIMARY KEY ("id"));
+CREATE INDEX "idx_name" ON "orders" ("name");
+
+/* !40101 SET character_set_client = @saved_cs_client */;
+
+-- ERROR: empty statement
+
+-- TODO: Unsupported MySQL-specific syntax; manual rewrite required
+-- /* Dumping data for table `orders` */ LOCK TABLES `orders` WRITE
+
+/* !40000 ALTER TABLE `orders` DISABLE KEYS */;
+
+-- ERROR: empty statement
+
+INSERT INTO "orders" VALUES (1, 'a'), (2, 'b;c');
+
+/* !40000 ALTER TABLE `orders` ENABLE KEYS */;
+
+-- ERROR: empty statement
+
+-- TODO: Unsupported MySQL-specific syntax; manual rewrite required
+-- UNLOCK TABLES
+
+/* !40103 SET TIME_ZONE=@OLD_TIME_ZONE */;
+
+-- ERROR: empty statement
+
+/* !40101 SET SQL_MODE=@OLD_SQL_MODE */;
+
+-- ERROR: empty statement
+
+/* !40014 SET FOREIGN_KEY_CHECKS=@OLD_FOREIGN_KEY_CHECKS */;
+
+-- ERROR: empty statement
+
+/* !40014 SET UNIQUE_CHECKS=@OLD_UNIQUE_CHECKS */;
+
+-- ERROR: empty statement
+
+/* !40101 SET CHARACTER_SET_CLIENT=@OLD_CHARACTER_SET_CLIENT */;
+
+-- ERROR: empty statement
+
+/* !40101 SET CHARACTER_SET_RESULTS=@OLD_CHARACTER_SET_RESULTS */;
+
+-- ERROR: empty statement
+
+/* !40101 SET COLLATION_CONNECTION=@OLD_COLLATION_CONNECTION */;
+
+-- ERROR: empty statement
+
+/* !40111 SET SQL_NOTES=@OLD_SQL_NOTES */;
+
+-- ERROR: empty statement
+
+/* Dump completed on 2024-03-01 12:00:00 */;
@@ -0,0 +1,68 @@
+"""CLI regression checks. Run from the repository root: python -m unittest discover -s test"""
+
+from pathlib import Path
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+import mysql2pgsql
+
+TEST_DIR = Path(__file__).resolve().parent
+
+
+def _expected(name: str) -> str:
+    # Fixtures are stored with CRLF line endings; the tool writes plain newlines.
+    return (TEST_DIR / f"{name}.pg.sql").read_bytes().decode("utf-8").replace("\r\n", "\n")
+
+
+class StreamedFixtureTest(unittest.TestCase):
+    """File mode converts in batches; it must match the fixtures whatever the batch size."""
+
+    FIXTURES = ("sample_mysql_statement_split", "sample_mysqldump", "sample_mysql_parse_error")
+
+    def _convert(self, name: str) -> str:
+        with (TEST_DIR / f"{name}.sql").open(encoding="utf-8-sig") as fp:
+            results = mysql2pgsql.convert_mysql_statements(mysql2pgsql.iter_statements(fp))
+            return mysql2pgsql.format_plain_sql_output(results)
+
+    def test_fixtures(self) -> None:
+        for batch_size in (mysql2pgsql._STREAM_BATCH_STATEMENTS, 1, 3):
+            for name in self.FIXTURES:
+                with self.subTest(name=name, batch_size=batch_size):
+                    with mock.patch.object(mysql2pgsql, "_STREAM_BATCH_STATEMENTS", batch_size):
+                        self.assertEqual(self._convert(name), _expected(name))
+
+
+class OutFileTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tmp_dir = Path(tmp.name)
+
+    def _read(self, path: Path) -> str:
+        with path.open(encoding="utf-8", newline="") as f:
+            return f.read().replace("\r\n", "\n")
+
+    def test_convert_file_onto_itself(self) -> None:
+        path = self.tmp_dir / "_tmp_users.sql"
+        shutil.copyfile(TEST_DIR / "_tmp_users.sql", path)
+
+        self.assertEqual(mysql2pgsql.main(["--in-file", str(path), "--out-file", str(path)]), 0)
+        self.assertEqual(self._read(path), _expected("_tmp_users"))
+        self.assertEqual(sorted(p.name for p in self.tmp_dir.iterdir()), ["_tmp_users.sql"])
+
+    def test_failed_run_keeps_existing_output(self) -> None:
+        out_path = self.tmp_dir / "out.pg.sql"
+        out_path.write_text("previous output\n", encoding="utf-8")
+
+        with mock.patch.object(mysql2pgsql, "_convert_text", side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                mysql2pgsql.main(["--in-file", str(TEST_DIR / "_tmp_users.sql"), "--out-file", str(out_path)])
+
+        self.assertEqual(out_path.read_text(encoding="utf-8"), "previous output\n")
+        self.assertEqual(sorted(p.name for p in self.tmp_dir.iterdir()), ["out.pg.sql"])
+
+
+if __name__ == "__main__":
+    unittest.main()